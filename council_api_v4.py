@@ -1,14 +1,14 @@
 from flask import Flask, request, jsonify, send_file
 from flask_cors import CORS
 import asyncio
-from playwright.async_api import async_playwright
 import time
 import json
 from pathlib import Path
-from docx import Document
-from docx.shared import Pt, RGBColor, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-import threading
+import traceback
+from collections import deque
+from council_startup import BrowserPool
+from council_reports import (add_blocks, blocks_to_text, error_blocks, failure_reason, is_captured,
+                             parse_blocks, save_report, to_blocks, PARAGRAPH, TIMED_OUT, TRUNCATED)
 
 app = Flask(__name__)
 CORS(app)
@@ -58,144 +58,560 @@ COUNCIL_PRESETS = {
 
 sessions = {}
 
-async def consult_agent(agent_name, agent_info, question, context=""):
-    full_question = f"{question}\n\nContext: {context}" if context else question
+# One shared browser per worker; started after fork (see gunicorn.conf.py) or on first request
+browser_pool = BrowserPool({name: info['url'] for name, info in ALL_AGENTS.items()})
+
+# Deliberation
+MAX_ROUNDS = 5
+
+# Response capture
+RESPONSE_POLL_SECONDS = 5
+RESPONSE_STABLE_SECONDS = 30   # a reply that stops growing for this long is treated as finished
+RESPONSE_SETTLED_SECONDS = 2 * RESPONSE_POLL_SECONDS   # at a cut-off, unchanged this long counts as complete
+
+# Deadline scheduling
+RESPONSE_WAIT_SECONDS = 180
+DEFAULT_AGENT_LATENCY = 90     # seconds from opening an agent to a finished reply, before any history exists
+MIN_RESPONSE_SECONDS = 30      # shortest useful time to let an agent write its answer
+CAPTURE_GRACE_SECONDS = 10     # reserved for scraping the response before the deadline
+LATENCY_SAMPLES = 20
+LATENCY_MAX_AGE_SECONDS = 30 * 60   # older samples are ignored, so a slow spell does not plan an agent out for good
+
+agent_latency = {}
+
+def record_latency(agent_name, seconds, complete=True):
+    samples = agent_latency.setdefault(agent_name, deque(maxlen=LATENCY_SAMPLES))
+    samples.append((time.monotonic(), seconds, complete))
+
+def record_unfinished(agent_name, started):
+    # A cut-off reply would have taken at least this long, but says nothing about how much longer
+    record_latency(agent_name, time.monotonic() - started, complete=False)
+
+def estimate_latency(agent_name):
+    """Median recent time to a finished reply; recent cut-offs can only raise it"""
+    oldest = time.monotonic() - LATENCY_MAX_AGE_SECONDS
+    recent = [(seconds, complete) for recorded_at, seconds, complete in agent_latency.get(agent_name, ()) if recorded_at >= oldest]
+    finished = sorted(seconds for seconds, complete in recent if complete)
+    lower_bounds = sorted(seconds for seconds, complete in recent if not complete)
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
+    estimate = finished[len(finished) // 2] if finished else DEFAULT_AGENT_LATENCY
+    if lower_bounds:
+        estimate = max(estimate, lower_bounds[len(lower_bounds) // 2])
+    return estimate
+
+def plan_advisors(advisors, budget):
+    """Split advisors into those expected to answer within budget and those skipped"""
+    selected, skipped = [], []
+    for name in advisors:
+        if estimate_latency(name) + CAPTURE_GRACE_SECONDS <= budget:
+            selected.append(name)
+        else:
+            skipped.append(name)
+    
+    # Always try at least the fastest advisor rather than returning nothing
+    if not selected and skipped:
+        fastest = min(skipped, key=estimate_latency)
+        skipped.remove(fastest)
+        selected.append(fastest)
+    
+    return selected, skipped
+
+def display_name(agent_name):
+    return agent_name.replace('DevilsAdvocate', "Devil's Advocate")
+
+# Marks replies already on the page so a follow-up only captures the new one
+MARK_SEEN_JS = """
+(selectors) => {
+    for (const selector of selectors) {
+        document.querySelectorAll(selector).forEach(e => e.setAttribute('data-council-seen', '1'));
+    }
+}
+"""
+
+# Returns the newest reply's blocks from index `start`, so each poll only transfers what changed.
+# The reply is looked up again on every poll in selector priority order; only a match on the
+# top selector is pinned, since nothing can outrank it. If the reply changes, `id` changes and
+# blocks are resent from 0. Elements whose text is just the submitted prompt are ignored.
+READ_BLOCKS_JS = """
+([selectors, token, start, prompt, knownId]) => {
+    const norm = s => s.replace(/\\s+/g, ' ').trim();
+    const asked = norm(prompt);
+    let el = document.querySelector(`[data-council-pinned="${token}"]`);
+    for (let i = 0; !el && i < selectors.length; i++) {
+        const fresh = Array.from(document.querySelectorAll(selectors[i])).filter(
+            e => !e.hasAttribute('data-council-seen') && norm(e.innerText) !== asked);
+        const last = fresh[fresh.length - 1];
+        if (last && last.innerText.length > 50) {
+            el = last;
+            if (i === 0) el.setAttribute('data-council-pinned', token);
+        }
+    }
+    if (!el) return null;
+    if (!el.dataset.councilId) {
+        window.councilIds = (window.councilIds || 0) + 1;
+        el.dataset.councilId = String(window.councilIds);
+    }
+    
+    const blockTags = 'h1,h2,h3,h4,h5,h6,li,p,pre,blockquote';
+    const structural = blockTags + ',table';
+    const blocks = [];
+    const pushLines = text => text.split('\\n').forEach(line => blocks.push(['text', line.trim()]));
+    const visit = node => {
+        if (node.nodeType === Node.TEXT_NODE) {
+            pushLines(node.textContent);
+            return;
+        }
+        if (node.nodeType !== Node.ELEMENT_NODE) return;
+        const tag = node.tagName.toLowerCase();
+        if (tag === 'script' || tag === 'style') return;
+        if (tag === 'table') {
+            const rows = Array.from(node.rows).map(
+                row => Array.from(row.cells).map(cell => norm(cell.innerText)).join('\\t'));
+            blocks.push(['table', rows.join('\\n')]);
+        } else if (node.matches(blockTags)) {
+            let kind = 'paragraph';
+            if (tag === 'h1' || tag === 'h2') kind = 'heading';
+            else if (tag[0] === 'h') kind = 'subheading';
+            else if (tag === 'li') kind = node.parentElement.tagName === 'OL' ? 'number' : 'bullet';
+            blocks.push([kind, node.innerText.trim()]);
+        } else if (!node.querySelector(structural)) {
+            // Plain containers (e.g. a div of text) keep their text line by line
+            pushLines(node.innerText);
+        } else {
+            node.childNodes.forEach(visit);
+        }
+    };
+    visit(el);
+    
+    const kept = blocks.filter(b => b[1]);
+    const id = el.dataset.councilId;
+    const from = id === knownId ? start : 0;
+    return {id: id, start: from, blocks: kept.slice(from)};
+}
+"""
+
+async def open_agent_page(agent_name):
+    """Take a page from the pool and make sure it is on the agent's URL"""
+    page, warm = await browser_pool.acquire_page(agent_name)
+    if not warm:
         try:
-            print(f"🔍 Consulting {agent_name}...")
-            await page.goto(agent_info['url'], timeout=60000, wait_until='networkidle')
-            
-            selectors = [
-                'textarea.active',
-                'textarea.search-input',
-                'textarea[name="query"]',
-                'textarea[placeholder*="Ask"]',
-                'input[type="text"]',
-                '[contenteditable="true"]'
-            ]
-            
-            input_field = None
-            for selector in selectors:
-                try:
-                    input_field = await page.wait_for_selector(selector, timeout=10000, state='visible')
-                    if input_field:
-                        print(f"✅ Found input field with selector: {selector}")
-                        break
-                except:
-                    continue
-            
-            if not input_field:
-                return f"[Error: Could not find input field for {agent_name}]"
-            
-            await input_field.fill(full_question)
-            await input_field.press('Enter')
-            print(f"✅ Submitted to {agent_name}")
-            
-            print(f"⏳ Waiting for {agent_name} response (180s timeout)...")
-            await page.wait_for_timeout(180000)
-            
-            response_selectors = [
-                '.response-content',
-                '.message-content',
-                '[role="article"]',
-                '.chat-message',
-                'div[class*="response"]',
-                'div[class*="answer"]'
-            ]
+            await page.goto(ALL_AGENTS[agent_name]['url'], timeout=60000, wait_until='networkidle')
+        except:
+            await browser_pool.release_page(agent_name, page)
+            raise
+    return page
+
+async def ask_agent(page, agent_name, prompt, deadline=None, started=None, followup=False):
+    """Submit a prompt on an open agent page and capture the reply; followup means earlier turns are on the page"""
+    try:
+        selectors = [
+            'textarea.active',
+            'textarea.search-input',
+            'textarea[name="query"]',
+            'textarea[placeholder*="Ask"]',
+            'input[type="text"]',
+            '[contenteditable="true"]'
+        ]
+        
+        input_field = None
+        for selector in selectors:
+            try:
+                input_field = await page.wait_for_selector(selector, timeout=10000, state='visible')
+                if input_field:
+                    print(f"✅ Found input field with selector: {selector}")
+                    break
+            except:
+                continue
+        
+        if not input_field:
+            return error_blocks(f"[Error: Could not find input field for {agent_name}]")
+        
+        response_selectors = [
+            '.response-content',
+            '.message-content',
+            '[role="article"]',
+            '.chat-message',
+            'div[class*="response"]',
+            'div[class*="answer"]'
+        ]
+        await page.evaluate(MARK_SEEN_JS, response_selectors)
+        
+        await input_field.fill(prompt)
+        await input_field.press('Enter')
+        print(f"✅ Submitted to {agent_name}")
+        
+        wait_seconds = RESPONSE_WAIT_SECONDS
+        if deadline is not None:
+            remaining = deadline - time.monotonic() - CAPTURE_GRACE_SECONDS
+            wait_seconds = max(0, min(wait_seconds, remaining))
+        
+        print(f"⏳ Streaming {agent_name} response ({int(wait_seconds)}s timeout)...")
+        token = f"{agent_name}-{time.monotonic_ns()}"
+        wait_until = time.monotonic() + wait_seconds
+        last_change = time.monotonic()
+        blocks = []
+        capture_id = None
+        finished = False
+        while True:
+            remaining = wait_until - time.monotonic()
+            if remaining <= 0:
+                break
+            await page.wait_for_timeout(min(RESPONSE_POLL_SECONDS, remaining) * 1000)
             
-            response_text = ""
-            for selector in response_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    if elements and len(elements) > 0:
-                        last_element = elements[-1]
-                        response_text = await last_element.inner_text()
-                        if response_text and len(response_text) > 50:
-                            break
-                except:
-                    continue
+            # Re-read the last block as well, it may still have been streaming
+            start = max(len(blocks) - 1, 0)
+            result = await page.evaluate(READ_BLOCKS_JS, [response_selectors, token, start, prompt, capture_id])
+            if result is None:
+                continue
+            capture_id = result['id']
+            start = result['start']
+            fresh = to_blocks(result['blocks'])
+            if fresh != blocks[start:]:
+                blocks[start:] = fresh
+                last_change = time.monotonic()
+            elif blocks and time.monotonic() - last_change >= RESPONSE_STABLE_SECONDS:
+                finished = True
+                break
+        
+        # A reply that stopped changing a little before the cut-off is complete, just not yet confirmed
+        settled = finished or (blocks and time.monotonic() - last_change >= RESPONSE_SETTLED_SECONDS)
+        if started is not None:
+            # Time from opening the agent to the reply's last change; the stability wait is not part of it
+            if settled:
+                record_latency(agent_name, last_change - started)
+            else:
+                record_unfinished(agent_name, started)
+            started = None   # a cancellation from here on must not add a second sample
+        
+        if not blocks:
+            result = await page.evaluate(READ_BLOCKS_JS, [response_selectors, token, 0, prompt, None])
+            blocks = to_blocks(result['blocks']) if result else []
+        
+        if deadline is not None:
+            # The body scrape below would pass off the echoed question and page chrome as an answer
+            if not blocks:
+                print(f"⏰ No reply from {agent_name} before the deadline")
+                return [(TIMED_OUT, f"[No reply from {agent_name} before the deadline]")]
+            if not settled:
+                print(f"⏰ {agent_name} was still replying at the deadline")
+                blocks.append((TRUNCATED, '[Reply cut off at the deadline]'))
+        
+        # On an open conversation the body scrape would return earlier turns as this round's answer
+        if not blocks and not followup:
+            page_text = await page.inner_text('body')
+            lines = page_text.split('\n')
+            blocks = parse_blocks('\n'.join([line for line in lines if len(line) > 30])[-2000:])
+        
+        print(f"✅ Captured response from {agent_name}: {len(blocks)} blocks")
+        
+        return blocks if blocks else error_blocks(f"[No response captured from {agent_name}]")
+        
+    except Exception as e:
+        print(f"❌ Error consulting {agent_name}: {str(e)}")
+        return error_blocks(f"[Error: {str(e)}]")
+    except asyncio.CancelledError:
+        # A deadline cancelled the consult mid-reply; errors above say nothing about latency
+        if started is not None:
+            record_unfinished(agent_name, started)
+        raise
+
+async def consult_agent(agent_name, agent_info, question, context="", deadline=None):
+    full_question = f"{question}\n\nContext: {context}" if context else question
+    started = time.monotonic()
+    
+    print(f"🔍 Consulting {agent_name}...")
+    try:
+        page = await open_agent_page(agent_name)
+    except Exception as e:
+        print(f"❌ Error consulting {agent_name}: {str(e)}")
+        return error_blocks(f"[Error: {str(e)}]")
+    except asyncio.CancelledError:
+        record_unfinished(agent_name, started)
+        raise
+    
+    try:
+        return await ask_agent(page, agent_name, full_question, deadline, started)
+    finally:
+        # Also runs when a deadline cancels this consult mid-flight
+        await browser_pool.release_page(agent_name, page)
+
+async def consult_on_open_page(agent_name, pages, prompt, deadline=None):
+    """Ask an advisor on its page for this council, opening it on first use"""
+    started = None
+    followup = agent_name in pages
+    if not followup:
+        print(f"🔍 Consulting {agent_name}...")
+        started = time.monotonic()
+        try:
+            pages[agent_name] = await open_agent_page(agent_name)
+        except Exception as e:
+            print(f"❌ Error consulting {agent_name}: {str(e)}")
+            return error_blocks(f"[Error: {str(e)}]")
+        except asyncio.CancelledError:
+            record_unfinished(agent_name, started)
+            raise
+    return await ask_agent(pages[agent_name], agent_name, prompt, deadline, started, followup)
+
+def rebuttal_prompt(round_number, agent_name, previous_round):
+    """Follow-up carrying only the other advisors' points from the previous round"""
+    points = [
+        f"**{display_name(name)}:**\n{blocks_to_text(response)}"
+        for name, response in previous_round.items()
+        if name != agent_name and is_captured(response)
+    ]
+    if not points:
+        return None
+    
+    return (
+        f"ROUND {round_number}: the other council members made these points since your last answer.\n\n"
+        + "\n\n".join(points)
+        + "\n\nRespond to their points: where you agree, where you disagree and why, "
+          "and whether this changes your recommendation."
+    )
+
+def synthesis_prompt(question, context, positions):
+    """Single prompt asking the Synthesiser to integrate the advisors' final positions"""
+    sections = [
+        f"**{display_name(name).upper()} - FINAL POSITION:**\n{blocks_to_text(blocks)}"
+        for name, blocks in positions.items()
+    ]
+    header = f'I have consulted the council on this question: "{question}"'
+    if context:
+        header += f"\n\nContext: {context}"
+    
+    return (
+        header + "\n\n" + "\n\n".join(sections)
+        + "\n\nSynthesize these perspectives into a unified recommendation: where they agree, "
+          "where they disagree and why, and the decision and next steps you recommend."
+    )
+
+def time_left_for(deadline, stages_left):
+    """Deadline for the next stage, splitting what is left of the budget evenly"""
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    return time.monotonic() + remaining / stages_left
+
+async def run_stage(prompts, pages, stage_deadline):
+    """Ask each advisor its prompt concurrently; returns answers and (advisor, reason) failures"""
+    tasks = {
+        asyncio.create_task(consult_on_open_page(name, pages, prompt, stage_deadline)): name
+        for name, prompt in prompts.items()
+    }
+    timeout = max(0, stage_deadline - time.monotonic()) if stage_deadline is not None else None
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    
+    answers = {}
+    failures = []
+    for task, name in tasks.items():
+        if task in pending:
+            print(f"⏰ {name} timed out")
+            failures.append((name, 'timed_out'))
+        elif task.cancelled() or task.exception() is not None:
+            failures.append((name, 'error'))
+        else:
+            # Placeholders are missing perspectives; a truncated reply is kept but still reported
+            result = task.result()
+            reason = failure_reason(result)
+            if is_captured(result):
+                answers[name] = result
+            if reason is not None:
+                failures.append((name, reason))
+    return answers, failures
+
+async def deliberate(session, question, context, advisors, rounds, deadline_seconds=None):
+    """Concurrent council over one or more rounds, each advisor keeping one open conversation"""
+    full_question = f"{question}\n\nContext: {context}" if context else question
+    deadline = time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+    
+    # With rebuttal rounds the Synthesiser doesn't debate; it is asked once, after the final round
+    synthesise_after = rounds > 1 and 'Synthesiser' in advisors
+    stages = rounds + 1 if synthesise_after else rounds
+    planned = list(advisors)
+    if deadline_seconds is not None:
+        planned, skipped = plan_advisors(advisors, deadline_seconds / stages)
+        session['missing'] = [{"advisor": name, "reason": "skipped"} for name in skipped]
+    active = [name for name in planned if not (synthesise_after and name == 'Synthesiser')]
+    
+    pages = {}
+    responses = {}
+    try:
+        for round_number in range(1, rounds + 1):
+            if round_number > 1 and deadline is not None \
+                    and deadline - time.monotonic() < MIN_RESPONSE_SECONDS + CAPTURE_GRACE_SECONDS:
+                print(f"⏰ No time left for round {round_number}")
+                break
             
-            if not response_text or len(response_text) < 50:
-                page_text = await page.inner_text('body')
-                lines = page_text.split('\n')
-                response_text = '\n'.join([line for line in lines if len(line) > 30])[-2000:]
+            if round_number == 1:
+                prompts = {name: full_question for name in active}
+            else:
+                previous_round = session['round_results'][-1]
+                prompts = {}
+                for name in active:
+                    prompt = rebuttal_prompt(round_number, name, previous_round)
+                    if prompt is not None:
+                        prompts[name] = prompt
+            if not prompts:
+                break
             
-            print(f"✅ Captured response from {agent_name}: {response_text[:100]}...")
+            session['progress'] = f'Round {round_number} of {rounds}: consulting {len(prompts)} council members...'
+            round_deadline = time_left_for(deadline, stages - round_number + 1)
+            round_responses, failures = await run_stage(prompts, pages, round_deadline)
             
-            await browser.close()
-            return response_text if response_text else f"[No response captured from {agent_name}]"
+            # A failed advisor's conversation is in an unknown state, so it sits out later rounds
+            for name, reason in failures:
+                print(f"⚠️  {name} dropped out in round {round_number} ({reason})")
+                active.remove(name)
+                session['missing'].append({"advisor": name, "reason": reason, "round": round_number})
             
-        except Exception as e:
-            await browser.close()
-            print(f"❌ Error consulting {agent_name}: {str(e)}")
-            return f"[Error: {str(e)}]"
+            # Keep preset order in the reports
+            round_responses = {name: round_responses[name] for name in advisors if name in round_responses}
+            session['round_results'].append(round_responses)
+            responses.update(round_responses)
+        
+        if synthesise_after and 'Synthesiser' in planned:
+            no_time = deadline is not None and deadline - time.monotonic() < MIN_RESPONSE_SECONDS + CAPTURE_GRACE_SECONDS
+            if no_time or not responses:
+                session['missing'].append({"advisor": "Synthesiser", "reason": "skipped"})
+            else:
+                session['progress'] = 'Synthesising final positions...'
+                prompts = {'Synthesiser': synthesis_prompt(question, context, responses)}
+                answers, failures = await run_stage(prompts, pages, deadline)
+                responses.update(answers)
+                for name, reason in failures:
+                    session['missing'].append({"advisor": name, "reason": reason})
+    finally:
+        for name, page in pages.items():
+            await browser_pool.release_page(name, page)
+    
+    return {name: responses[name] for name in advisors if name in responses}
 
-def generate_word_docs(session_id, question, context, responses):
-    # Executive Summary
-    exec_doc = Document()
-    exec_doc.add_heading('AI COUNCIL - EXECUTIVE SUMMARY', 0)
-    exec_doc.add_paragraph(f'Session: {session_id}')
-    exec_doc.add_paragraph(f'Question: {question}')
-    if context:
-        exec_doc.add_paragraph(f'Context: {context}')
+def partial_synthesis(responses, missing):
+    """Stand-in synthesis built locally from the perspectives that were captured"""
+    heard = [name for name in responses if name != 'Synthesiser' and is_captured(responses[name])]
+    if not heard:
+        return parse_blocks('Synthesis not available: no council members responded.')
     
-    exec_doc.add_heading('RECOMMENDATION', 1)
-    if 'Synthesiser' in responses:
-        exec_doc.add_paragraph(responses['Synthesiser'])
-    else:
-        exec_doc.add_paragraph('Synthesis not available.')
+    # Advisors that dropped out in a later round still have an earlier answer
+    unheard = [m['advisor'] for m in missing if m['advisor'] != 'Synthesiser' and m['advisor'] not in responses]
+    blocks = [(PARAGRAPH, f'Partial synthesis from {len(heard)} of {len(heard) + len(unheard)} council members '
+                          f'(no Synthesiser response was available).')]
+    for name in heard:
+        first_paragraph = next((text for kind, text in responses[name] if kind == PARAGRAPH), '')[:500]
+        blocks.append((PARAGRAPH, f'{display_name(name)}: {first_paragraph}'))
+    if unheard:
+        blocks.append((PARAGRAPH, 'Missing perspectives: ' + ', '.join(unheard)))
+    return blocks
+
+def generate_word_docs(session_id, question, context, responses, missing=None, round_results=None):
+    from docx import Document
     
-    exec_path = f'/tmp/Council_Executive_{session_id}.docx'
-    exec_doc.save(exec_path)
+    # Deliberations that lost their Synthesiser fall back to a synthesis of what arrived
+    synthesis = responses.get('Synthesiser')
+    if synthesis is None and missing is not None:
+        synthesis = partial_synthesis(responses, missing)
     
-    # Full Report
+    # Both reports share their opening sections, so write those in one pass
+    exec_doc = Document()
     full_doc = Document()
+    exec_doc.add_heading('AI COUNCIL - EXECUTIVE SUMMARY', 0)
     full_doc.add_heading('AI COUNCIL DELIBERATION', 0)
-    full_doc.add_paragraph(f'Session: {session_id}')
-    full_doc.add_paragraph(f'Question: {question}')
-    if context:
-        full_doc.add_paragraph(f'Context: {context}')
+    for doc in (exec_doc, full_doc):
+        doc.add_paragraph(f'Session: {session_id}')
+        doc.add_paragraph(f'Question: {question}')
+        if context:
+            doc.add_paragraph(f'Context: {context}')
     
+    exec_doc.add_heading('RECOMMENDATION', 1)
     full_doc.add_heading('SYNTHESIS', 1)
-    if 'Synthesiser' in responses:
-        full_doc.add_paragraph(responses['Synthesiser'])
+    if synthesis is not None:
+        add_blocks((exec_doc, full_doc), synthesis)
     else:
+        exec_doc.add_paragraph('Synthesis not available.')
         full_doc.add_paragraph('[Synthesis error: No synthesis available]')
     
-    full_doc.add_heading('ADVISOR PERSPECTIVES', 1)
-    for agent_name, response in responses.items():
-        if agent_name != 'Synthesiser':
-            full_doc.add_heading(agent_name.replace('DevilsAdvocate', "Devil's Advocate"), 2)
-            full_doc.add_paragraph(response)
+    # Executive Summary is complete; release it before building the rest of the full report
+    exec_path = save_report(exec_doc, f'Council_Executive_{session_id}.docx')
+    del exec_doc
     
-    full_path = f'/tmp/Council_Full_{session_id}.docx'
-    full_doc.save(full_path)
+    if round_results and len(round_results) > 1:
+        for round_number, round_responses in enumerate(round_results, start=1):
+            stage = 'OPENING POSITIONS' if round_number == 1 else 'REBUTTALS'
+            full_doc.add_heading(f'ROUND {round_number} - {stage}', 1)
+            for agent_name, response in round_responses.items():
+                if agent_name != 'Synthesiser':
+                    full_doc.add_heading(display_name(agent_name), 2)
+                    add_blocks((full_doc,), response)
+    else:
+        full_doc.add_heading('ADVISOR PERSPECTIVES', 1)
+        for agent_name, response in responses.items():
+            if agent_name != 'Synthesiser':
+                full_doc.add_heading(display_name(agent_name), 2)
+                add_blocks((full_doc,), response)
     
-    return {'executive': exec_path, 'full': full_path}
+    if missing:
+        full_doc.add_heading('MISSING PERSPECTIVES', 1)
+        for entry in missing:
+            reason = {
+                'timed_out': 'timed out',
+                'truncated': 'cut off at the deadline (partial answer kept)',
+                'error': 'failed (error or no response captured)',
+            }.get(entry['reason'], 'skipped (not expected to finish in time)')
+            if entry.get('round', 1) > 1 and entry['reason'] != 'truncated':
+                reason += f" in round {entry['round']} (its answer from an earlier round is kept)"
+            full_doc.add_paragraph(f"{display_name(entry['advisor'])}: {reason}")
+    
+    return {'executive': exec_path, 'full': save_report(full_doc, f'Council_Full_{session_id}.docx')}
 
-async def run_council(session_id, question, context, advisors):
+async def run_council(session_id, question, context, advisors, deadline_seconds=None, rounds=1):
     sessions[session_id]['status'] = 'in_progress'
     sessions[session_id]['progress'] = f'Consulting {len(advisors)} council members...'
     
     responses = {}
-    for advisor_name in advisors:
-        if advisor_name in ALL_AGENTS:
-            sessions[session_id]['progress'] = f'Consulting {advisor_name}...'
-            response = await consult_agent(advisor_name, ALL_AGENTS[advisor_name], question, context)
-            responses[advisor_name] = response
+    missing = None
+    if deadline_seconds is None and rounds == 1:
+        for advisor_name in advisors:
+            if advisor_name in ALL_AGENTS:
+                sessions[session_id]['progress'] = f'Consulting {advisor_name}...'
+                response = await consult_agent(advisor_name, ALL_AGENTS[advisor_name], question, context)
+                responses[advisor_name] = response
+        sessions[session_id]['round_results'] = [responses]
+    else:
+        responses = await deliberate(sessions[session_id], question, context, advisors, rounds, deadline_seconds)
+        missing = sessions[session_id]['missing']
     
     sessions[session_id]['progress'] = 'Generating reports...'
-    docs = generate_word_docs(session_id, question, context, responses)
+    docs = await asyncio.to_thread(generate_word_docs, session_id, question, context, responses, missing,
+                                   sessions[session_id]['round_results'])
     
     sessions[session_id]['status'] = 'complete'
     sessions[session_id]['responses'] = responses
     sessions[session_id]['docs'] = docs
     sessions[session_id]['progress'] = 'Complete'
 
+def council_finished(session_id, future):
+    # Without this an exception in run_council vanishes with its future
+    if future.cancelled():
+        exc = RuntimeError('Council was cancelled')
+    else:
+        exc = future.exception()
+    if exc is None:
+        return
+    
+    print(f"❌ Council {session_id} failed:")
+    traceback.print_exception(exc)
+    sessions[session_id]['status'] = 'error'
+    sessions[session_id]['progress'] = f'Error: {str(exc)}'
+
+@app.before_request
+def start_browser_pool():
+    browser_pool.start()
+
 @app.route('/api/health', methods=['GET'])
 def health():
     return jsonify({
@@ -204,16 +620,30 @@ def health():
         "version": "4.0"
     })
 
+@app.route('/api/ready', methods=['GET'])
+def ready():
+    status = browser_pool.status()
+    return jsonify(status), (200 if status['ready'] else 503)
+
 @app.route('/api/council/start', methods=['POST'])
 def start_council():
     data = request.json
     question = data.get('question', '')
     context = data.get('context', '')
     preset = data.get('preset', 'core')
+    deadline_seconds = data.get('deadline_seconds')
+    rounds = data.get('rounds', 1)
     
     if not question:
         return jsonify({"error": "Question is required"}), 400
     
+    if deadline_seconds is not None:
+        if isinstance(deadline_seconds, bool) or not isinstance(deadline_seconds, (int, float)) or deadline_seconds <= 0:
+            return jsonify({"error": "deadline_seconds must be a positive number"}), 400
+    
+    if isinstance(rounds, bool) or not isinstance(rounds, int) or not 1 <= rounds <= MAX_ROUNDS:
+        return jsonify({"error": f"rounds must be an integer between 1 and {MAX_ROUNDS}"}), 400
+    
     advisors = COUNCIL_PRESETS.get(preset, COUNCIL_PRESETS['core'])
     session_id = str(int(time.time()))
     
@@ -223,20 +653,23 @@ def start_council():
         "advisors": advisors,
         "status": "started",
         "progress": "Initializing...",
+        "deadline_seconds": deadline_seconds,
+        "rounds": rounds,
+        "round_results": [],
+        "missing": [],
         "responses": {},
         "docs": {}
     }
     
-    def run_async_council():
-        asyncio.run(run_council(session_id, question, context, advisors))
-    
-    thread = threading.Thread(target=run_async_council, daemon=True)
-    thread.start()
+    future = browser_pool.submit(run_council(session_id, question, context, advisors, deadline_seconds, rounds))
+    future.add_done_callback(lambda f: council_finished(session_id, f))
     
     return jsonify({
         "session_id": session_id,
         "status": "started",
-        "advisors": advisors
+        "advisors": advisors,
+        "deadline_seconds": deadline_seconds,
+        "rounds": rounds
     })
 
 @app.route('/api/council/status/<session_id>', methods=['GET'])
@@ -247,7 +680,9 @@ def get_status(session_id):
     session = sessions[session_id]
     return jsonify({
         "status": session['status'],
-        "progress": session['progress']
+        "progress": session['progress'],
+        "rounds_completed": len(session['round_results']),
+        "missing": session['missing']
     })
 
 @app.route('/api/council/download/full/<session_id>', methods=['GET'])
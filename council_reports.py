@@ -0,0 +1,121 @@
+import os
+import re
+import tempfile
+
+# Responses are kept as a list of (kind, text) blocks rather than one big string
+HEADING = 'heading'
+SUBHEADING = 'subheading'
+BULLET = 'bullet'
+NUMBER = 'number'
+PARAGRAPH = 'paragraph'
+TABLE = 'table'                     # text is rows separated by newlines, cells by tabs
+ERROR = 'error'                     # placeholder for a failed consult, never part of a real reply
+TIMED_OUT = 'timed_out'             # placeholder for a consult with no reply before its deadline
+TRUNCATED = 'truncated'             # marker appended to a reply cut off while still streaming
+
+_HEADING = re.compile(r'^(#{1,6})(?:\s+(.*))?$')
+_NUMBERED = re.compile(r'^\d{1,3}[.)]\s+')   # a short list number, not a year like "2024. was"
+_BULLET_MARKERS = ('- ', '* ', '• ', '– ')
+
+def classify_line(line):
+    """Turn one line of plain or markdown-ish text into a block, or None if blank"""
+    stripped = line.strip()
+    if not stripped:
+        return None
+
+    heading = _HEADING.match(stripped)
+    if heading:
+        text = (heading.group(2) or '').strip()
+        return (HEADING if len(heading.group(1)) <= 2 else SUBHEADING, text) if text else None
+    # Only a line bolded as a whole is a heading, not one like "**Note:** x **y**"
+    if len(stripped) > 4 and stripped.startswith('**') and stripped.endswith('**') and '**' not in stripped[2:-2]:
+        return (SUBHEADING, stripped.strip('*').strip())
+    for marker in _BULLET_MARKERS:
+        if stripped.startswith(marker):
+            return (BULLET, stripped[len(marker):].strip())
+    match = _NUMBERED.match(stripped)
+    if match:
+        return (NUMBER, stripped[match.end():])
+    return (PARAGRAPH, stripped)
+
+def error_blocks(message):
+    return [(ERROR, message)]
+
+def failure_reason(blocks):
+    """'error', 'timed_out' or 'truncated' when a consult gave no complete reply, else None"""
+    if not blocks:
+        return ERROR
+    if blocks[0][0] in (ERROR, TIMED_OUT):
+        return blocks[0][0]
+    if blocks[-1][0] == TRUNCATED:
+        return TRUNCATED
+    return None
+
+def is_captured(blocks):
+    """True for a real reply, even a truncated one; False for a failed consult's placeholder"""
+    return failure_reason(blocks) in (None, TRUNCATED)
+
+def parse_blocks(text):
+    blocks = []
+    for line in text.split('\n'):
+        block = classify_line(line)
+        if block is not None:
+            blocks.append(block)
+    return blocks
+
+def to_blocks(raw_blocks):
+    """Normalise [kind, text] pairs read from the page; plain 'text' lines get classified here"""
+    blocks = []
+    for kind, text in raw_blocks:
+        block = classify_line(text) if kind == 'text' else (kind, text)
+        # Never drop a block: polling offsets assume one block here per block on the page
+        blocks.append(block if block is not None else (PARAGRAPH, text))
+    return blocks
+
+def blocks_to_text(blocks):
+    """Render blocks back to markdown-ish text, e.g. for follow-up prompts"""
+    lines = []
+    number = 0
+    for kind, text in blocks:
+        number = number + 1 if kind == NUMBER else 0
+        if kind == HEADING:
+            lines.append(f'## {text}')
+        elif kind == SUBHEADING:
+            lines.append(f'### {text}')
+        elif kind == BULLET:
+            lines.append(f'- {text}')
+        elif kind == NUMBER:
+            lines.append(f'{number}. {text}')
+        elif kind == TABLE:
+            lines.extend(' | '.join(row.split('\t')) for row in text.split('\n'))
+        else:
+            lines.append(text)
+    return '\n'.join(lines)
+
+def add_blocks(docs, blocks):
+    """Append blocks to every document in docs, in a single pass over the blocks"""
+    for kind, text in blocks:
+        for doc in docs:
+            if kind == HEADING:
+                doc.add_heading(text, 3)
+            elif kind == SUBHEADING:
+                doc.add_heading(text, 4)
+            elif kind == BULLET:
+                doc.add_paragraph(text, style='List Bullet')
+            elif kind == NUMBER:
+                doc.add_paragraph(text, style='List Number')
+            elif kind == TABLE:
+                rows = [row.split('\t') for row in text.split('\n')]
+                table = doc.add_table(rows=len(rows), cols=max(len(cells) for cells in rows))
+                table.style = 'Table Grid'
+                for cells, row in zip(rows, table.rows):
+                    for value, cell in zip(cells, row.cells):
+                        cell.text = value
+            else:
+                doc.add_paragraph(text)
+
+def save_report(doc, filename):
+    """Save a document to the temp dir and return its path; nothing stays open or in RAM"""
+    path = os.path.join(tempfile.gettempdir(), filename)
+    doc.save(path)
+    return path
@@ -0,0 +1,211 @@
+import asyncio
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+WARMUP_RETRY_SECONDS = 10
+WARMUP_MAX_RETRY_SECONDS = 300
+
+def _playwright_package_dir():
+    # find_spec locates the package without importing playwright itself
+    spec = importlib.util.find_spec('playwright')
+    if spec is None or spec.origin is None:
+        return None
+    return Path(spec.origin).parent
+
+def chromium_revision():
+    """Chromium build revision the installed playwright package expects"""
+    package_dir = _playwright_package_dir()
+    if package_dir is None:
+        return None
+    browsers_json = package_dir / 'driver' / 'package' / 'browsers.json'
+    for browser in json.loads(browsers_json.read_text())['browsers']:
+        if browser['name'] == 'chromium':
+            return browser['revision']
+    return None
+
+def browsers_path():
+    """Directory playwright installs browsers into, mirroring its own lookup rules"""
+    override = os.environ.get('PLAYWRIGHT_BROWSERS_PATH')
+    if override == '0':
+        return _playwright_package_dir() / 'driver' / 'package' / '.local-browsers'
+    if override:
+        return Path(override)
+    if sys.platform == 'darwin':
+        return Path.home() / 'Library' / 'Caches' / 'ms-playwright'
+    if sys.platform == 'win32':
+        return Path(os.environ.get('LOCALAPPDATA', Path.home())) / 'ms-playwright'
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'ms-playwright'
+
+def chromium_installed():
+    try:
+        revision = chromium_revision()
+        if revision is None:
+            return False
+        return (browsers_path() / f'chromium-{revision}' / 'INSTALLATION_COMPLETE').exists()
+    except Exception:
+        # Anything unexpected just means we fall back to a normal install
+        return False
+
+def ensure_browser_installed():
+    """Install Chromium only when the build playwright expects is missing"""
+    if chromium_installed():
+        print(f"✅ Chromium {chromium_revision()} already installed, skipping install")
+        return
+
+    print("📦 Installing Chromium for playwright...")
+    subprocess.run([sys.executable, '-m', 'playwright', 'install', 'chromium'], check=True)
+
+class BrowserPool:
+    """Shared Chromium on a dedicated event loop, with one warm page per agent"""
+
+    def __init__(self, agent_urls):
+        self.agent_urls = agent_urls
+        self.loop = None
+        self.state = 'cold'
+        self.error = None
+        self.browser = None
+        self._playwright = None
+        self._warm_pages = {}
+        self._background = set()
+        self._warmup_task = None
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._launch_lock = asyncio.Lock()
+
+    def start(self):
+        """Start the pool's event loop and begin warming up in the background"""
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self.loop.run_forever, name='browser-pool', daemon=True)
+            self._thread.start()
+        self.loop.call_soon_threadsafe(self._schedule_warm_up)
+
+    def submit(self, coro):
+        """Run a coroutine on the pool's loop; playwright objects are bound to it"""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def status(self):
+        connected = self.browser is not None and self.browser.is_connected()
+        return {
+            "ready": self.state == 'ready' and connected,
+            "state": self.state,
+            "browser": connected,
+            "warm_pages": sorted(list(self._warm_pages)),
+            "cold_pages": sorted(name for name in self.agent_urls if name not in self._warm_pages),
+            "error": self.error
+        }
+
+    async def ensure_browser(self):
+        async with self._launch_lock:
+            if self.browser is not None and self.browser.is_connected():
+                return self.browser
+
+            # Deferred so importing the app never pays for playwright
+            from playwright.async_api import async_playwright
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            print("🌐 Launching Chromium...")
+            self.browser = await self._playwright.chromium.launch(headless=True)
+            self.browser.on('disconnected', self._on_disconnected)
+            return self.browser
+
+    def _schedule_warm_up(self):
+        # Runs on the pool's loop; one warm-up at a time is enough
+        if self._warmup_task is None or self._warmup_task.done():
+            self._warmup_task = self.loop.create_task(self.warm_up())
+
+    def _on_disconnected(self, browser):
+        if browser is not self.browser:
+            return
+        # Chromium crashed or was killed and its pages went with it, so warm a fresh one
+        print("⚠️  Chromium disconnected, relaunching...")
+        self._warm_pages.clear()
+        self.state = 'warming'
+        self._schedule_warm_up()
+
+    async def warm_up(self):
+        """Keep retrying with backoff until the browser is up and every agent page is warm"""
+        self.state = 'warming'
+        delay = WARMUP_RETRY_SECONDS
+        while True:
+            try:
+                await self.ensure_browser()
+            except Exception as e:
+                self.error = str(e)
+                print(f"❌ Browser launch failed, retrying in {delay}s: {e}")
+            else:
+                results = await asyncio.gather(
+                    *(self._open_warm_page(name) for name in self.agent_urls), return_exceptions=True
+                )
+                failed = {name: result for name, result in zip(self.agent_urls, results) if isinstance(result, Exception)}
+
+                # Usable as soon as the browser and some agent pages are; the rest keep retrying
+                if self._warm_pages:
+                    self.state = 'ready'
+                if not failed:
+                    self.error = None
+                    print(f"✅ Browser pool ready ({len(self._warm_pages)} agent pages warm)")
+                    return
+                self.error = '; '.join(f"{name}: {e}" for name, e in failed.items())
+                print(f"⚠️  {len(failed)} agent pages failed to warm, retrying in {delay}s")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARMUP_MAX_RETRY_SECONDS)
+
+    async def _open_warm_page(self, agent_name):
+        existing = self._warm_pages.get(agent_name)
+        if existing is not None and not existing.is_closed():
+            return
+
+        browser = await self.ensure_browser()
+        page = await browser.new_page()
+        try:
+            await page.goto(self.agent_urls[agent_name], timeout=60000, wait_until='networkidle')
+        except Exception:
+            await page.close()
+            raise
+
+        # Another council may have re-warmed this agent while we navigated
+        existing = self._warm_pages.get(agent_name)
+        if existing is not None and not existing.is_closed():
+            await page.close()
+            return
+        self._warm_pages[agent_name] = page
+
+    async def _replenish(self, agent_name):
+        try:
+            await self._open_warm_page(agent_name)
+            self.state = 'ready'
+        except Exception as e:
+            print(f"⚠️  Could not re-warm page for {agent_name}: {e}")
+
+    async def acquire_page(self, agent_name):
+        """Return (page, warm); a warm page is already loaded on the agent's URL"""
+        page = self._warm_pages.pop(agent_name, None)
+        if page is not None and not page.is_closed():
+            return page, True
+
+        browser = await self.ensure_browser()
+        return await browser.new_page(), False
+
+    async def release_page(self, agent_name, page):
+        """Close a used page and warm a fresh one for the next council"""
+        try:
+            await page.close()
+        except Exception:
+            pass
+        task = asyncio.create_task(self._replenish(agent_name))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+if __name__ == "__main__":
+    ensure_browser_installed()
@@ -0,0 +1,5 @@
+def post_worker_init(worker):
+    # Warm the browser pool in each worker once it is forked and has loaded the app,
+    # so nothing is started in the master (or lost across a --preload fork)
+    from council_api_v4 import browser_pool
+    browser_pool.start()
@@ -1,3 +1,3 @@
 #!/bin/bash
-python -m playwright install chromium
+python council_startup.py
 gunicorn --bind 0.0.0.0:$PORT council_api_v4:app